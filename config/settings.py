@@ -11,9 +11,15 @@ PROJECT_ROOT = Path(__file__).parent.parent
 # 스크래핑 설정
 SCRAPING_CONFIG = {
     'BASE_URL': 'https://dhlottery.co.kr/gameResult.do',
-    'REQUEST_DELAY': 1.0,  # 요청 간격 (초)
+    'API_URL': 'https://www.dhlottery.co.kr/common.do',  # 회차별 당첨번호 JSON
+    'RATE_LIMIT': 5.0,     # 초당 최대 요청 수 (전체 워커 공유)
+    'CONCURRENCY': 8,      # 동시 요청 워커 수
+    'CHECKPOINT_INTERVAL': 50,  # 중간 저장 간격 (회차 수)
+    'LATEST_ROUND_TTL': 6 * 3600,  # 최신 회차 캐시 유효 시간 (초, 추첨은 주 1회)
     'MAX_RETRIES': 3,      # 최대 재시도 횟수
     'TIMEOUT': 10,         # 요청 타임아웃 (초)
+    'HTML_PARSER': 'lxml', # BeautifulSoup 파서 (lxml 미설치 시 html.parser 사용)
+    'RESPONSE_ENCODING': 'euc-kr',  # Content-Type에 charset이 없을 때 사용할 인코딩
     'USER_AGENT': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
 }
 
@@ -22,6 +28,7 @@ PATHS = {
     'DATA_DIR': PROJECT_ROOT / 'data',
     'LOGS_DIR': PROJECT_ROOT / 'logs',
     'OUTPUT_FILE': PROJECT_ROOT / 'data' / 'lotto_numbers.csv',
+    'LATEST_ROUND_CACHE': PROJECT_ROOT / 'data' / 'latest_round.json',
 }
 
 # 로깅 설정
@@ -2,16 +2,27 @@
 로또 데이터 처리 및 CSV 저장 클래스
 """
 
+import numpy as np
 import pandas as pd
 from pathlib import Path
+from operator import attrgetter
 from typing import List, Optional
 import logging
 
-from models import LottoData
-from utils import create_output_directory, format_amount
+from models import LottoData, LottoBatch
+from utils import (
+    create_output_directory, format_amount,
+    validate_winning_numbers_batch, validate_bonus_number_batch
+)
 from exceptions import FileOperationError, DataValidationError
 from config.settings import PATHS, CSV_CONFIG
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pyarrow 미설치 시 pandas CSV writer 사용
+    pa = None
+
 
 class DataProcessor:
     """로또 데이터 처리 및 저장 클래스"""
@@ -24,6 +35,9 @@ class DataProcessor:
             output_path: 출력 파일 경로
         """
         self.output_path = Path(output_path) if output_path else PATHS['OUTPUT_FILE']
+        self.checkpoint_path = self.output_path.with_name(
+            f"{self.output_path.stem}.partial{self.output_path.suffix}"
+        )
         self.logger = logging.getLogger('lotto_scraper')
         
         # 출력 디렉토리 생성
@@ -46,17 +60,15 @@ class DataProcessor:
                 self.logger.warning("처리할 데이터가 없습니다.")
                 return pd.DataFrame()
             
-            # 데이터를 딕셔너리 리스트로 변환
-            data_dicts = [lotto_data.to_dict() for lotto_data in data]
-            
-            # DataFrame 생성
-            df = pd.DataFrame(data_dicts)
+            # 데이터 정렬 (회차순) - DataFrame 정렬보다 객체 리스트 정렬이 저렴
+            data = sorted(data, key=attrgetter('round_num'))
             
-            # 데이터 검증
-            self._validate_dataframe(df)
+            # 컬럼별 배열로 모은 뒤 배열 상태에서 일괄 검증
+            batch = LottoBatch.from_records(data)
+            self._validate_batch(batch)
             
-            # 데이터 정렬 (회차순)
-            df = df.sort_values('회차').reset_index(drop=True)
+            # DataFrame 생성 (인덱스는 이미 0..N-1)
+            df = pd.DataFrame(batch.to_columns())
             
             self.logger.info(f"데이터 처리 완료: {len(df)}개 행")
             return df
@@ -65,6 +77,10 @@ class DataProcessor:
             self.logger.error(f"데이터 처리 실패: {e}")
             raise DataValidationError(f"데이터 처리 실패: {e}")
     
+    def _build_dataframe(self, data: List[LottoData]) -> pd.DataFrame:
+        """LottoData 리스트를 컬럼별 배열로 모아 DataFrame 생성"""
+        return pd.DataFrame(LottoBatch.from_records(data).to_columns())
+    
     def save_to_csv(self, df: pd.DataFrame, output_path: Optional[str] = None) -> Path:
         """
         DataFrame을 CSV 파일로 저장
@@ -86,11 +102,7 @@ class DataProcessor:
             file_path.parent.mkdir(parents=True, exist_ok=True)
             
             # CSV 저장
-            df.to_csv(
-                file_path,
-                encoding=CSV_CONFIG['ENCODING'],
-                index=CSV_CONFIG['INDEX']
-            )
+            self._write_csv(df, file_path)
             
             self.logger.info(f"CSV 파일 저장 완료: {file_path}")
             return file_path
@@ -99,6 +111,43 @@ class DataProcessor:
             self.logger.error(f"CSV 저장 실패: {e}")
             raise FileOperationError(f"CSV 저장 실패: {e}")
     
+    def _write_csv(self, df: pd.DataFrame, file_path: Path):
+        """CSV 쓰기 (pyarrow가 있으면 C++ writer 사용)"""
+        # 실수 컬럼은 pyarrow와 pandas의 표기가 달라(689000000 / 689000000.0)
+        # 컬럼명이 문자열이고 정수·문자열 컬럼만 있을 때만 pyarrow로 기록해 pandas 출력과 같게 유지
+        use_arrow = (
+            pa is not None
+            and not CSV_CONFIG['INDEX']
+            and CSV_CONFIG['ENCODING'].lower().replace('-', '') == 'utf8'
+            and all(isinstance(label, str) for label in df.columns)
+            and all(
+                pd.api.types.is_integer_dtype(column) or pd.api.types.is_string_dtype(column)
+                for _, column in df.items()
+            )
+        )
+        
+        if use_arrow:
+            try:
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                with open(file_path, 'wb') as f:
+                    # pyarrow는 헤더를 항상 따옴표로 감싸므로 pandas와 같은 형식으로 직접 기록
+                    f.write((','.join(df.columns) + '\n').encode('utf-8'))
+                    pa_csv.write_csv(
+                        table,
+                        f,
+                        write_options=pa_csv.WriteOptions(include_header=False, quoting_style='none')
+                    )
+                return
+            except pa.ArrowInvalid:
+                # 따옴표 처리가 필요한 값이 있으면 pandas writer로 다시 기록
+                pass
+        
+        df.to_csv(
+            file_path,
+            encoding=CSV_CONFIG['ENCODING'],
+            index=CSV_CONFIG['INDEX']
+        )
+    
     def load_from_csv(self, file_path: Optional[str] = None) -> pd.DataFrame:
         """
         CSV 파일에서 데이터 로드
@@ -129,6 +178,70 @@ class DataProcessor:
             self.logger.error(f"CSV 로드 실패: {e}")
             raise FileOperationError(f"CSV 로드 실패: {e}")
     
+    def load_existing_data(self) -> pd.DataFrame:
+        """
+        이전 실행에서 저장된 데이터 로드 (출력 파일 + 중간 저장 파일)
+        
+        Returns:
+            회차순으로 정렬된 pandas DataFrame
+        """
+        df = self.load_from_csv()
+        
+        if self.checkpoint_path.exists():
+            checkpoint_df = self.load_from_csv(str(self.checkpoint_path))
+            df = self.merge_data(df, checkpoint_df)
+        
+        # 잘못 저장된 회차는 이미 수집된 것으로 보지 않고 다시 수집하도록 제외
+        return self._drop_invalid_rows(df, "기존 데이터")
+    
+    def merge_data(self, existing: pd.DataFrame, new: pd.DataFrame) -> pd.DataFrame:
+        """
+        기존 데이터와 새 데이터 병합 (회차 중복 시 새 데이터 우선)
+        
+        Args:
+            existing: 기존 DataFrame
+            new: 새로 수집한 DataFrame
+            
+        Returns:
+            회차순으로 정렬된 병합 DataFrame
+        """
+        if existing.empty:
+            return new
+        if new.empty:
+            return existing
+        
+        df = pd.concat([existing, new], ignore_index=True)
+        df = df.drop_duplicates('회차', keep='last')
+        return df.sort_values('회차').reset_index(drop=True)
+    
+    def append_checkpoint(self, data: List[LottoData]):
+        """
+        수집 중인 데이터를 중간 저장 파일에 추가
+        
+        Args:
+            data: LottoData 객체 리스트
+        """
+        try:
+            # 스크래퍼가 회차별로 검증한 행이므로 여기서 다시 검증하지 않는다
+            # (이어받기 시 load_existing_data가 저장된 행을 검증)
+            df = self._build_dataframe(data)
+            df.to_csv(
+                self.checkpoint_path,
+                mode='a',
+                header=not self.checkpoint_path.exists(),
+                encoding=CSV_CONFIG['ENCODING'],
+                index=CSV_CONFIG['INDEX']
+            )
+            self.logger.info(f"중간 저장 완료: {len(df)}개 회차 ({self.checkpoint_path})")
+            
+        except Exception as e:
+            self.logger.error(f"중간 저장 실패: {e}")
+            raise FileOperationError(f"중간 저장 실패: {e}")
+    
+    def clear_checkpoint(self):
+        """중간 저장 파일 삭제"""
+        self.checkpoint_path.unlink(missing_ok=True)
+    
     def validate_data(self, df: pd.DataFrame) -> bool:
         """
         데이터 유효성 검사
@@ -156,21 +269,24 @@ class DataProcessor:
                 self.logger.error("회차 중복 발견")
                 return False
             
-            # 당첨번호 유효성 검사
-            for i in range(1, 7):
-                col_name = f'당첨번호{i}'
-                if col_name in df.columns:
-                    invalid_numbers = df[~df[col_name].between(1, 45)]
-                    if not invalid_numbers.empty:
-                        self.logger.error(f"{col_name}에 유효하지 않은 번호 발견")
-                        return False
-            
-            # 보너스번호 유효성 검사
-            if '보너스번호' in df.columns:
-                invalid_bonus = df[~df['보너스번호'].between(1, 45)]
-                if not invalid_bonus.empty:
-                    self.logger.error("보너스번호에 유효하지 않은 번호 발견")
-                    return False
+            # 당첨번호 및 보너스번호 범위 검사 (전체 번호 컬럼을 한 번에 비교)
+            number_columns = [f'당첨번호{i}' for i in range(1, 7)] + ['보너스번호']
+            numbers = df[number_columns].to_numpy()
+            # NaN은 비교 결과가 False이므로 범위 밖으로 처리된다
+            in_range = (numbers >= 1) & (numbers <= 45)
+            if not in_range.all():
+                invalid_columns = [
+                    col_name for col_name, invalid
+                    in zip(number_columns, (~in_range).any(axis=0)) if invalid
+                ]
+                self.logger.error(f"{', '.join(invalid_columns)}에 유효하지 않은 번호 발견")
+                return False
+            
+            # 번호 중복, 추첨일, 당첨금 검사 (process_data와 같은 행 단위 일괄 검증)
+            invalid = self._invalid_rows(df)
+            if invalid.any():
+                self.logger.error(f"유효하지 않은 회차 데이터: {df['회차'][invalid].tolist()}")
+                return False
             
             self.logger.info("데이터 유효성 검사 통과")
             return True
@@ -179,18 +295,64 @@ class DataProcessor:
             self.logger.error(f"데이터 유효성 검사 실패: {e}")
             return False
     
-    def _validate_dataframe(self, df: pd.DataFrame):
-        """DataFrame 내부 검증"""
+    def _validate_batch(self, batch: LottoBatch):
+        """LottoBatch 일괄 검증 (스크래퍼의 회차별 검증 이후 유일한 일괄 검증)"""
+        # 회차 중복 확인
+        if np.unique(batch.round_nums).size != len(batch):
+            raise DataValidationError("회차에 중복이 있습니다.")
+        
+        invalid = self._invalid_mask(
+            batch.winning_numbers,
+            batch.bonus_numbers,
+            batch.draw_dates,
+            batch.first_prize_winners,
+            batch.first_prize_amounts
+        )
+        if invalid.any():
+            raise DataValidationError(f"유효하지 않은 회차 데이터: {batch.round_nums[invalid].tolist()}")
+    
+    def _invalid_rows(self, df: pd.DataFrame) -> pd.Series:
+        """번호/추첨일/당첨금 검증에 실패한 행 (bool Series)"""
+        invalid = self._invalid_mask(
+            df[[f'당첨번호{i}' for i in range(1, 7)]].to_numpy(),
+            df['보너스번호'].to_numpy(),
+            df['추첨일'].to_numpy(),
+            df['1등당첨자수'].to_numpy(),
+            df['1등당첨금액'].to_numpy()
+        )
+        return pd.Series(invalid, index=df.index)
+    
+    def _invalid_mask(
+        self,
+        numbers: np.ndarray,
+        bonus: np.ndarray,
+        draw_dates: np.ndarray,
+        winners: np.ndarray,
+        amounts: np.ndarray
+    ) -> np.ndarray:
+        """번호/추첨일/당첨금 검증에 실패한 행 (N,) bool 배열"""
+        draw_dates = pd.to_datetime(draw_dates, format='%Y-%m-%d', errors='coerce')
+        
+        return (
+            ~validate_winning_numbers_batch(numbers)
+            | ~validate_bonus_number_batch(bonus, numbers)
+            | draw_dates.isna()
+            # NaN도 실패로 처리되도록 >= 0의 부정으로 비교
+            | ~(winners >= 0)
+            | ~(amounts >= 0)
+        )
+    
+    def _drop_invalid_rows(self, df: pd.DataFrame, source: str) -> pd.DataFrame:
+        """검증에 실패한 행을 제외하고 제외한 회차를 로그로 남김"""
         if df.empty:
-            raise DataValidationError("DataFrame이 비어있습니다.")
+            return df
         
-        # 회차 컬럼 확인
-        if '회차' not in df.columns:
-            raise DataValidationError("회차 컬럼이 없습니다.")
+        invalid = self._invalid_rows(df)
+        if not invalid.any():
+            return df
         
-        # 회차 중복 확인
-        if df['회차'].duplicated().any():
-            raise DataValidationError("회차에 중복이 있습니다.")
+        self.logger.error(f"{source}: 유효하지 않은 회차 제외 {df['회차'][invalid].tolist()}")
+        return df[~invalid].reset_index(drop=True)
     
     def get_statistics(self, df: pd.DataFrame) -> dict:
         """
@@ -206,16 +368,21 @@ class DataProcessor:
             if df.empty:
                 return {}
             
+            # 숫자 컬럼은 NumPy 배열에서 직접 집계 (pandas Series 메서드 디스패치 생략)
+            rounds = df['회차'].to_numpy()
+            winners = df['1등당첨자수'].to_numpy()
+            amounts = df['1등당첨금액'].to_numpy()
+            
             stats = {
                 '총_회차수': len(df),
-                '시작_회차': df['회차'].min(),
-                '종료_회차': df['회차'].max(),
+                '시작_회차': rounds.min(),
+                '종료_회차': rounds.max(),
                 '시작_날짜': df['추첨일'].min(),
                 '종료_날짜': df['추첨일'].max(),
-                '평균_1등당첨자수': df['1등당첨자수'].mean(),
-                '평균_1등당첨금액': df['1등당첨금액'].mean(),
-                '최대_1등당첨금액': df['1등당첨금액'].max(),
-                '최소_1등당첨금액': df['1등당첨금액'].min()
+                '평균_1등당첨자수': winners.mean(),
+                '평균_1등당첨금액': amounts.mean(),
+                '최대_1등당첨금액': amounts.max(),
+                '최소_1등당첨금액': amounts.min()
             }
             
             return stats
@@ -2,6 +2,8 @@
 로또 스크래핑 관련 커스텀 예외 클래스들
 """
 
+from typing import Optional
+
 
 class LottoScrapingError(Exception):
     """로또 스크래핑 기본 예외 클래스"""
@@ -13,6 +15,14 @@ class NetworkError(LottoScrapingError):
     pass
 
 
+class RetryableNetworkError(NetworkError):
+    """재시도로 회복될 수 있는 네트워크 오류 (연결 실패, 429, 5xx)"""
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after  # 서버가 Retry-After로 지정한 대기 시간 (초)
+
+
 class ParsingError(LottoScrapingError):
     """HTML 파싱 관련 오류"""
     pass
@@ -2,21 +2,130 @@
 로또 당첨번호 스크래핑 메인 클래스
 """
 
-import time
 import re
+import json
+import time
 import requests
-from bs4 import BeautifulSoup
-from typing import List, Optional, Dict, Any
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, FeatureNotFound, ElementFilter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import attrgetter, itemgetter
+from typing import List, Optional, Dict, Any, Set, Callable, Union
 from urllib.parse import urljoin
 import logging
 
 from models import LottoData
 from utils import (
     setup_logging, clean_number_string, parse_date_string,
-    validate_winning_numbers, validate_bonus_number, retry_on_exception
+    winning_numbers_mask, validate_bonus_number_mask, validate_draw_date, retry_on_exception,
+    parse_retry_after, RateLimiter
 )
-from exceptions import NetworkError, ParsingError, DataValidationError
-from config.settings import SCRAPING_CONFIG
+from exceptions import NetworkError, RetryableNetworkError, ParsingError, DataValidationError
+from config.settings import SCRAPING_CONFIG, PATHS
+
+# 회차마다 반복 사용하는 정규식은 모듈 로드 시 한 번만 컴파일
+_RE_ROUND = re.compile(r'(\d+)회')
+_RE_DATE = re.compile(r'(\d{4}\.\d{1,2}\.\d{1,2})')
+_RE_DATE_LOOSE = re.compile(r'\d{4}[-./]\d{1,2}[-./]\d{1,2}')
+_RE_PRIZE = re.compile(r'1등 총 (\d+)명.*?(\d{1,3}(?:,\d{3})*)원')
+_RE_DIGITS = re.compile(r'\d+')
+
+
+class _ResultSectionFilter(ElementFilter):
+    """회차 결과 페이지에서 추출에 쓰는 요소만 트리로 만드는 파싱 필터"""
+    
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        attrs = attrs or {}
+        if name == 'meta':
+            return attrs.get('name') == 'description'
+        
+        classes = attrs.get('class', '')
+        if isinstance(classes, str):
+            classes = classes.split()
+        
+        # div.num.win / div.num.bonus / table.tbl_data
+        if name == 'div':
+            return 'num' in classes
+        if name == 'table':
+            return 'tbl_data' in classes
+        return False
+    
+    def allow_string_creation(self, string: str) -> bool:
+        # 메타 태그에 추첨일이 없을 때 _extract_draw_date가 본문에서 찾을 수 있도록
+        # 날짜 형태의 텍스트 노드는 남긴다
+        return _RE_DATE_LOOSE.search(string) is not None
+
+
+# 광고/메뉴/푸터 등 나머지 노드는 만들지 않는다 (날짜 형태의 텍스트 제외)
+_RESULT_SECTION_FILTER = _ResultSectionFilter()
+
+# JSON API 응답에서 필요한 필드를 한 번의 호출로 꺼내는 getter
+_ROW_FIELDS = itemgetter(
+    'drwNo', 'drwNoDate',
+    'drwtNo1', 'drwtNo2', 'drwtNo3', 'drwtNo4', 'drwtNo5', 'drwtNo6',
+    'bnusNo', 'firstPrzwnerCo', 'firstWinamnt'
+)
+
+
+def _validate_row(
+    round_num: int,
+    draw_date: str,
+    winning_numbers: List[int],
+    bonus_number: int,
+    first_prize_winners: int,
+    first_prize_amount: int
+):
+    """
+    회차 한 건의 전체 필드 검증 (LottoData.construct_unchecked 호출 전)
+    
+    잘못된 회차는 여기서 실패 처리되어 결과 목록과 중간 저장 파일에 들어가지 않는다.
+    
+    Raises:
+        DataValidationError: 검증 실패
+    """
+    # 당첨번호 비트마스크를 보너스번호 중복 검사에 재사용
+    winning_mask = winning_numbers_mask(winning_numbers)
+    if winning_mask is None:
+        raise DataValidationError(f"회차 {round_num}: 당첨번호 검증 실패")
+    
+    if not validate_bonus_number_mask(bonus_number, winning_mask):
+        raise DataValidationError(f"회차 {round_num}: 보너스번호 검증 실패")
+    
+    if not validate_draw_date(draw_date):
+        raise DataValidationError(f"회차 {round_num}: 추첨일 검증 실패 ({draw_date!r})")
+    
+    if first_prize_winners < 0 or first_prize_amount < 0:
+        raise DataValidationError(f"회차 {round_num}: 1등 당첨자수/당첨금액 검증 실패")
+
+
+def parse_lotto_row(raw: Dict[str, Any]) -> LottoData:
+    """
+    JSON API 응답 한 건을 LottoData로 변환
+    
+    필드 추출, 정수 변환, 행 검증을 한 번에 처리한다.
+    
+    Raises:
+        KeyError, ValueError, TypeError: 필드 누락 또는 숫자가 아닌 값
+        DataValidationError: 당첨번호/보너스번호/추첨일/당첨금 검증 실패
+    """
+    round_num, draw_date, *numbers, bonus_number, winners, amount = _ROW_FIELDS(raw)
+    round_num = int(round_num)
+    draw_date = parse_date_string(draw_date)
+    winning_numbers = [int(num) for num in numbers]
+    bonus_number = int(bonus_number)
+    winners = int(winners)
+    amount = int(amount)
+    
+    _validate_row(round_num, draw_date, winning_numbers, bonus_number, winners, amount)
+    
+    return LottoData.construct_unchecked(
+        round_num=round_num,
+        draw_date=draw_date,
+        winning_numbers=winning_numbers,
+        bonus_number=bonus_number,
+        first_prize_winners=winners,
+        first_prize_amount=amount
+    )
 
 
 class LottoScraper:
@@ -34,27 +143,94 @@ class LottoScraper:
         self.session.headers.update({
             'User-Agent': self.config['USER_AGENT']
         })
+        
+        # 워커 수만큼 keep-alive 연결을 풀에 유지해 TLS 핸드셰이크를 재사용
+        # (BASE_URL과 API_URL의 호스트가 달라 호스트별 풀 2개를 유지)
+        adapter = HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=self.config['CONCURRENCY'],
+            pool_block=True
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # 재시도 횟수는 설정값을 따르도록 인스턴스 생성 시 데코레이터 적용
+        self._make_request = retry_on_exception(
+            max_retries=self.config['MAX_RETRIES'],
+            delay=0.5,
+            max_delay=10.0,
+            exceptions=(RetryableNetworkError,)
+        )(self._make_request)
+        
+        # 모든 워커가 공유하는 요청 속도 제한
+        self.rate_limiter = RateLimiter(self.config['RATE_LIMIT'])
         self.logger = setup_logging()
         
+        # 실행 중 한 번 조회한 최신 회차는 재사용
+        self._latest_round: Optional[int] = None
+        
     def get_latest_round(self) -> int:
-        """최신 회차 번호 조회"""
+        """최신 회차 번호 조회 (실행 중 메모리 캐시 + 디스크 TTL 캐시)"""
+        if self._latest_round is not None:
+            return self._latest_round
+        
+        cached = self._load_latest_round_cache()
+        if cached and time.time() - cached['fetched_at'] < self.config['LATEST_ROUND_TTL']:
+            self.logger.info(f"최신 회차 (캐시): {cached['round']}")
+            self._latest_round = cached['round']
+            return self._latest_round
+        
         try:
             self.logger.info("최신 회차 조회 중...")
             
             # 메인 페이지에서 최신 회차 정보 추출
             # BASE_URL 단독 호출 시 400 응답이 발생하므로 method 파라미터를 포함해 요청한다
             response = self._make_request(f"{self.config['BASE_URL']}?method=byWin")
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = self._make_soup(response.content, self._response_encoding(response))
             
             # 최신 회차 번호 추출 로직
             latest_round = self._extract_latest_round(soup)
             
-            self.logger.info(f"최신 회차: {latest_round}")
-            return latest_round
-            
         except Exception as e:
-            self.logger.error(f"최신 회차 조회 실패: {e}")
-            raise NetworkError(f"최신 회차 조회 실패: {e}")
+            if not cached:
+                self.logger.error(f"최신 회차 조회 실패: {e}")
+                raise NetworkError(f"최신 회차 조회 실패: {e}")
+            
+            self.logger.warning(f"최신 회차 조회 실패, 이전 조회 값 사용: {e}")
+            latest_round = None
+        
+        if latest_round is None:
+            if cached:
+                latest_round = cached['round']
+            else:
+                # 한 번도 조회에 성공한 적이 없을 때만 대략적인 값 사용
+                self.logger.warning("최신 회차 추출 실패, 기본값 사용")
+                latest_round = 1200  # 2024년 기준 대략적인 회차
+        else:
+            self._save_latest_round_cache(latest_round)
+        
+        self.logger.info(f"최신 회차: {latest_round}")
+        self._latest_round = latest_round
+        return latest_round
+    
+    def _load_latest_round_cache(self) -> Optional[Dict[str, Any]]:
+        """디스크에 저장된 최신 회차 캐시 로드"""
+        try:
+            with open(PATHS['LATEST_ROUND_CACHE'], encoding='utf-8') as f:
+                cached = json.load(f)
+            return {'round': int(cached['round']), 'fetched_at': float(cached['fetched_at'])}
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
+    def _save_latest_round_cache(self, latest_round: int):
+        """최신 회차 캐시 저장 (실패해도 스크래핑은 계속)"""
+        try:
+            cache_path = PATHS['LATEST_ROUND_CACHE']
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump({'round': latest_round, 'fetched_at': time.time()}, f)
+        except OSError as e:
+            self.logger.warning(f"최신 회차 캐시 저장 실패: {e}")
     
     def scrape_round(self, round_num: int) -> Optional[LottoData]:
         """
@@ -69,62 +245,155 @@ class LottoScraper:
         try:
             self.logger.info(f"회차 {round_num} 스크래핑 시작...")
             
-            # 요청 URL 구성
-            url = f"{self.config['BASE_URL']}?method=byWin&drwNo={round_num}"
-            
-            # HTTP 요청
-            response = self._make_request(url)
-            
-            # HTML 파싱
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # 데이터 추출
-            lotto_data = self._parse_round_data(soup, round_num)
+            # JSON API가 실패하면 HTML 결과 페이지로 대체
+            try:
+                lotto_data = self._scrape_round_json(round_num)
+            except (NetworkError, ParsingError) as e:
+                self.logger.warning(f"회차 {round_num} JSON 조회 실패, HTML 페이지로 재시도: {e}")
+                lotto_data = self._scrape_round_html(round_num)
             
             if lotto_data:
                 self.logger.info(f"회차 {round_num} 스크래핑 완료")
             else:
                 self.logger.warning(f"회차 {round_num} 데이터 없음")
             
-            # 요청 간격 대기
-            time.sleep(self.config['REQUEST_DELAY'])
-            
             return lotto_data
             
         except Exception as e:
             self.logger.error(f"회차 {round_num} 스크래핑 실패: {e}")
             return None
     
-    def scrape_all_rounds(self, start: int = 1, end: Optional[int] = None) -> List[LottoData]:
+    def _scrape_round_json(self, round_num: int) -> Optional[LottoData]:
+        """JSON API로 회차 데이터 조회 (HTML 대비 전송량과 파싱 비용이 작음)"""
+        response = self._make_request(
+            self.config['API_URL'],
+            params={'method': 'getLottoNumber', 'drwNo': round_num}
+        )
+        
+        try:
+            payload = response.json()
+        except ValueError as e:
+            raise ParsingError(f"회차 {round_num} JSON 파싱 실패: {e}")
+        
+        # 존재하지 않는 회차는 returnValue가 fail로 응답된다
+        if payload.get('returnValue') != 'success':
+            return None
+        
+        return self._parse_round_json(payload, round_num)
+    
+    def _scrape_round_html(self, round_num: int) -> Optional[LottoData]:
+        """HTML 결과 페이지로 회차 데이터 조회"""
+        # 요청 URL 구성
+        url = f"{self.config['BASE_URL']}?method=byWin&drwNo={round_num}"
+        
+        # HTTP 요청
+        response = self._make_request(url)
+        
+        # HTML 파싱 (회차당 한 번, 결과 영역만 파싱하고 추출 함수에 트리를 전달)
+        soup = self._make_soup(
+            response.content,
+            self._response_encoding(response),
+            parse_only=_RESULT_SECTION_FILTER
+        )
+        
+        # 데이터 추출
+        return self._parse_round_data(soup, round_num)
+    
+    def scrape_all_rounds(
+        self,
+        start: int = 1,
+        end: Optional[int] = None,
+        skip_rounds: Optional[Set[int]] = None,
+        checkpoint: Optional[Callable[[List[LottoData]], None]] = None
+    ) -> List[LottoData]:
         """
         전체 회차 데이터 스크래핑
         
         Args:
             start: 시작 회차
             end: 종료 회차 (None이면 최신 회차까지)
+            skip_rounds: 이미 수집되어 건너뛸 회차 집합
+            checkpoint: CHECKPOINT_INTERVAL개마다 새로 수집된 데이터를 넘겨받는 콜백
             
         Returns:
-            LottoData 객체 리스트
+            LottoData 객체 리스트 (건너뛴 회차 제외)
         """
+        # 잘못된 범위는 네트워크 요청 전에 거른다
+        if start < 1:
+            raise DataValidationError(f"시작 회차는 1 이상이어야 합니다. 현재: {start}")
+        
         if end is None:
             end = self.get_latest_round()
         
+        if end < start:
+            raise DataValidationError(f"종료 회차가 시작 회차보다 작습니다. 시작: {start}, 종료: {end}")
+        
+        skip_rounds = skip_rounds or set()
+        rounds = [r for r in range(start, end + 1) if r not in skip_rounds]
+        
         self.logger.info(f"회차 {start}부터 {end}까지 스크래핑 시작...")
         
+        skipped = end - start + 1 - len(rounds)
+        if skipped:
+            self.logger.info(f"이미 수집된 {skipped}개 회차 건너뜀")
+        
         results = []
         failed_rounds = []
+        pending = []
         
-        for round_num in range(start, end + 1):
+        # 네트워크 대기가 대부분이므로 스레드 풀로 여러 회차를 동시에 요청한다
+        with ThreadPoolExecutor(max_workers=self.config['CONCURRENCY']) as executor:
+            futures = {
+                executor.submit(self.scrape_round, round_num): round_num
+                for round_num in rounds
+            }
+            
+            handled = set()
             try:
-                lotto_data = self.scrape_round(round_num)
-                if lotto_data:
-                    results.append(lotto_data)
-                else:
-                    failed_rounds.append(round_num)
+                for future in as_completed(futures):
+                    handled.add(future)
+                    round_num = futures[future]
+                    try:
+                        lotto_data = future.result()
+                        if lotto_data:
+                            results.append(lotto_data)
+                            pending.append(lotto_data)
+                        else:
+                            failed_rounds.append(round_num)
+                            
+                    except Exception as e:
+                        self.logger.error(f"회차 {round_num} 처리 중 오류: {e}")
+                        failed_rounds.append(round_num)
                     
-            except Exception as e:
-                self.logger.error(f"회차 {round_num} 처리 중 오류: {e}")
-                failed_rounds.append(round_num)
+                    # 중단되더라도 수집분을 잃지 않도록 주기적으로 중간 저장
+                    if checkpoint and len(pending) >= self.config['CHECKPOINT_INTERVAL']:
+                        checkpoint(pending)
+                        pending = []
+            
+            except BaseException:
+                # Ctrl-C 또는 중간 저장 실패 시 대기 중인 회차는 취소하고 실행 중인 요청만
+                # 마무리한 뒤, 아직 저장하지 않은 수집분을 저장하고 다시 던진다
+                executor.shutdown(cancel_futures=True)
+                
+                # 중단 시점에 실행 중이던 요청의 결과도 버리지 않는다
+                for future in futures:
+                    if (future in handled or not future.done() or future.cancelled()
+                            or future.exception() is not None):
+                        continue
+                    lotto_data = future.result()
+                    if lotto_data:
+                        pending.append(lotto_data)
+                
+                if checkpoint and pending:
+                    try:
+                        checkpoint(pending)
+                    except Exception as e:
+                        self.logger.error(f"중간 저장 실패: {e}")
+                raise
+        
+        # 완료 순서가 뒤섞이므로 회차순으로 정렬
+        results.sort(key=attrgetter('round_num'))
+        failed_rounds.sort()
         
         self.logger.info(f"스크래핑 완료: 성공 {len(results)}개, 실패 {len(failed_rounds)}개")
         
@@ -133,22 +402,69 @@ class LottoScraper:
         
         return results
     
-    @retry_on_exception(max_retries=3, delay=1.0)
-    def _make_request(self, url: str) -> requests.Response:
-        """HTTP 요청 (재시도 로직 포함)"""
+    def _make_request(self, url: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
+        """
+        HTTP 요청 (429/5xx/연결 오류만 재시도, 그 외 4xx는 즉시 실패)
+        
+        재시도 데코레이터는 MAX_RETRIES 설정을 쓰도록 __init__에서 적용한다.
+        """
+        self.rate_limiter.acquire()
+        
         try:
             response = self.session.get(
                 url, 
+                params=params,
                 timeout=self.config['TIMEOUT']
             )
+        except requests.exceptions.RequestException as e:
+            raise RetryableNetworkError(f"HTTP 요청 실패: {e}")
+        
+        status = response.status_code
+        if status == 429 or status >= 500:
+            raise RetryableNetworkError(
+                f"HTTP 요청 실패: {status} ({url})",
+                retry_after=parse_retry_after(response.headers.get('Retry-After'))
+            )
+        
+        try:
             response.raise_for_status()
             return response
             
         except requests.exceptions.RequestException as e:
             raise NetworkError(f"HTTP 요청 실패: {e}")
     
-    def _extract_latest_round(self, soup: BeautifulSoup) -> int:
-        """최신 회차 번호 추출"""
+    def _make_soup(
+        self,
+        markup: Union[str, bytes],
+        encoding: Optional[str] = None,
+        parse_only: Optional[ElementFilter] = None
+    ) -> BeautifulSoup:
+        """
+        HTML 파싱 (C 기반 lxml 파서 우선, 미설치 시 html.parser 사용)
+        
+        Args:
+            markup: HTML 문자열 또는 응답 바이트
+            encoding: 바이트 입력의 인코딩 (지정 시 문자셋 추정 생략)
+            parse_only: 트리로 만들 요소를 제한하는 필터
+        """
+        options = {'parse_only': parse_only}
+        if isinstance(markup, bytes) and encoding:
+            options['from_encoding'] = encoding
+        
+        try:
+            return BeautifulSoup(markup, self.config['HTML_PARSER'], **options)
+        except FeatureNotFound:
+            return BeautifulSoup(markup, 'html.parser', **options)
+    
+    def _response_encoding(self, response: requests.Response) -> str:
+        """응답 인코딩 결정 (헤더의 charset 우선, 없으면 설정값 사용)"""
+        # response.text는 charset이 없으면 본문 전체로 문자셋을 추정하므로 이를 피한다
+        if 'charset' in response.headers.get('Content-Type', '').lower():
+            return response.encoding
+        return self.config['RESPONSE_ENCODING']
+    
+    def _extract_latest_round(self, soup: BeautifulSoup) -> Optional[int]:
+        """최신 회차 번호 추출 (찾지 못하면 None)"""
         try:
             # 회차 선택 드롭다운에서 최신 회차 추출
             select_element = soup.find('select', {'id': 'dwrNoList'})
@@ -163,16 +479,15 @@ class LottoScraper:
             meta_desc = soup.find('meta', {'name': 'description'})
             if meta_desc and meta_desc.get('content'):
                 content = meta_desc.get('content')
-                match = re.search(r'(\d+)회', content)
+                match = _RE_ROUND.search(content)
                 if match:
                     return int(match.group(1))
             
-            # 기본값 반환 (현재 시점 기준 대략적인 최신 회차)
-            return 1200  # 2024년 기준 대략적인 회차
+            return None
             
         except Exception as e:
-            self.logger.warning(f"최신 회차 추출 실패, 기본값 사용: {e}")
-            return 1200
+            self.logger.warning(f"최신 회차 추출 실패: {e}")
+            return None
     
     def _parse_round_data(self, soup: BeautifulSoup, round_num: int) -> Optional[LottoData]:
         """회차 데이터 파싱"""
@@ -195,14 +510,13 @@ class LottoScraper:
             # 당첨자수 및 당첨금액 추출
             first_prize_winners, first_prize_amount = self._extract_prize_info(soup)
             
-            # 데이터 검증
-            if not validate_winning_numbers(winning_numbers):
-                raise DataValidationError(f"회차 {round_num}: 당첨번호 검증 실패")
-            
-            if not validate_bonus_number(bonus_number, winning_numbers):
-                raise DataValidationError(f"회차 {round_num}: 보너스번호 검증 실패")
+            # 데이터 검증 (통과한 행만 검증 없이 생성)
+            _validate_row(
+                round_num, draw_date, winning_numbers, bonus_number,
+                first_prize_winners, first_prize_amount
+            )
             
-            return LottoData(
+            return LottoData.construct_unchecked(
                 round_num=round_num,
                 draw_date=draw_date,
                 winning_numbers=winning_numbers,
@@ -215,6 +529,13 @@ class LottoScraper:
             self.logger.error(f"회차 {round_num} 데이터 파싱 실패: {e}")
             raise ParsingError(f"회차 {round_num} 데이터 파싱 실패: {e}")
     
+    def _parse_round_json(self, payload: Dict[str, Any], round_num: int) -> LottoData:
+        """JSON API 응답 파싱"""
+        try:
+            return parse_lotto_row(payload)
+        except Exception as e:
+            raise ParsingError(f"회차 {round_num} JSON 데이터 파싱 실패: {e}")
+    
     def _extract_winning_numbers(self, soup: BeautifulSoup) -> List[int]:
         """당첨번호 추출"""
         try:
@@ -224,18 +545,11 @@ class LottoScraper:
                 self.logger.warning("당첨번호 섹션을 찾을 수 없습니다")
                 return []
             
-            # 당첨번호 공들 추출
-            ball_elements = winning_section.find_all('span', class_='ball_645')
-            
-            if not ball_elements:
-                self.logger.warning("당첨번호 공을 찾을 수 없습니다")
-                return []
-            
-            numbers = []
-            for element in ball_elements:
-                num = clean_number_string(element.text)
-                if 1 <= num <= 45:
-                    numbers.append(num)
+            # 섹션 텍스트 전체에서 숫자를 한 번에 추출 (공마다 변환 함수를 호출하지 않음)
+            numbers = [
+                num for num in map(int, _RE_DIGITS.findall(winning_section.get_text(' ')))
+                if 1 <= num <= 45
+            ]
             
             # 6개 번호인지 확인
             if len(numbers) == 6:
@@ -282,13 +596,13 @@ class LottoScraper:
             if meta_desc and meta_desc.get('content'):
                 content = meta_desc.get('content')
                 # 날짜 패턴 찾기 (예: 2025.03.14)
-                date_match = re.search(r'(\d{4}\.\d{1,2}\.\d{1,2})', content)
+                date_match = _RE_DATE.search(content)
                 if date_match:
                     date_str = date_match.group(1)
                     return parse_date_string(date_str)
             
             # 대안: 페이지에서 날짜 패턴 직접 검색
-            date_elements = soup.find_all(text=re.compile(r'\d{4}[-./]\d{1,2}[-./]\d{1,2}'))
+            date_elements = soup.find_all(string=_RE_DATE_LOOSE)
             if date_elements:
                 date_str = date_elements[0].strip()
                 return parse_date_string(date_str)
@@ -313,22 +627,20 @@ class LottoScraper:
             for row in rows:
                 cells = row.find_all('td')
                 if len(cells) >= 4 and cells[0].text.strip() == '1등':
-                    # 당첨자수 (3번째 셀)
-                    winners_text = cells[2].text.strip()
-                    winners = clean_number_string(winners_text)
-                    
-                    # 1게임당 당첨금액 (4번째 셀)
-                    amount_text = cells[3].text.strip()
-                    amount = clean_number_string(amount_text)
-                    
-                    return winners, amount
+                    # 행 텍스트의 숫자: [순위, 총 당첨금액, 당첨자수, 1게임당 당첨금액, ...]
+                    values = [
+                        int(value)
+                        for value in _RE_DIGITS.findall(row.get_text(' ').replace(',', ''))
+                    ]
+                    if len(values) >= 4:
+                        return values[2], values[3]
             
             # 대안: 메타 태그에서 정보 추출
             meta_desc = soup.find('meta', {'name': 'description'})
             if meta_desc and meta_desc.get('content'):
                 content = meta_desc.get('content')
                 # 1등 총 28명, 1인당 당첨금액 985,155,349원 패턴
-                match = re.search(r'1등 총 (\d+)명.*?(\d{1,3}(?:,\d{3})*)원', content)
+                match = _RE_PRIZE.search(content)
                 if match:
                     winners = clean_number_string(match.group(1))
                     amount = clean_number_string(match.group(2))
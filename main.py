@@ -11,6 +11,7 @@ from lotto_scraper import LottoScraper
 from data_processor import DataProcessor
 from utils import setup_logging
 from exceptions import LottoScrapingError
+from config.settings import SCRAPING_CONFIG
 
 
 def parse_arguments():
@@ -24,6 +25,7 @@ def parse_arguments():
   python main.py --start 1 --end 100       # 1회차부터 100회차까지
   python main.py --output data/my_data.csv  # 출력 파일 지정
   python main.py --verbose                  # 상세 로그 출력
+  python main.py --workers 4 --delay 0.5    # 워커 4개, 전체 요청 간격 0.5초
         """
     )
     
@@ -55,18 +57,31 @@ def parse_arguments():
     parser.add_argument(
         '--delay',
         type=float,
-        default=1.0,
-        help='요청 간격 (초) (기본값: 1.0)'
+        help=f"전체 워커 공유 요청 간격 (초) (기본값: {1 / SCRAPING_CONFIG['RATE_LIMIT']:g})"
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help=f"동시 요청 워커 수 (기본값: {SCRAPING_CONFIG['CONCURRENCY']})"
     )
     
     parser.add_argument(
         '--max-retries',
         type=int,
-        default=3,
-        help='최대 재시도 횟수 (기본값: 3)'
+        help=f"최대 재시도 횟수 (기본값: {SCRAPING_CONFIG['MAX_RETRIES']})"
     )
     
-    return parser.parse_args()
+    args = parser.parse_args()
+    
+    if args.delay is not None and args.delay <= 0:
+        parser.error('--delay는 0보다 커야 합니다')
+    if args.workers is not None and args.workers < 1:
+        parser.error('--workers는 1 이상이어야 합니다')
+    if args.max_retries is not None and args.max_retries < 1:
+        parser.error('--max-retries는 1 이상이어야 합니다')
+    
+    return args
 
 
 def main():
@@ -84,33 +99,47 @@ def main():
         logger.info(f"종료 회차: {args.end if args.end else '최신 회차'}")
         logger.info(f"출력 파일: {args.output if args.output else 'data/lotto_numbers.csv'}")
         
-        # 스크래퍼 초기화
-        scraper = LottoScraper()
+        # 스크래퍼 초기화 (명령행 인수로 동시성, 요청 속도, 재시도 횟수 조정)
+        config = dict(SCRAPING_CONFIG)
+        if args.workers is not None:
+            config['CONCURRENCY'] = args.workers
+        if args.delay is not None:
+            config['RATE_LIMIT'] = 1.0 / args.delay
+        if args.max_retries is not None:
+            config['MAX_RETRIES'] = args.max_retries
+        
+        scraper = LottoScraper(config)
         
         # 데이터 프로세서 초기화
         processor = DataProcessor(args.output)
         
         try:
+            # 이전 실행에서 저장된 회차는 다시 수집하지 않는다
+            existing_df = processor.load_existing_data()
+            done_rounds = set(existing_df['회차'].astype(int)) if not existing_df.empty else set()
+            
             # 스크래핑 실행
             logger.info("스크래핑 시작...")
-            lotto_data = scraper.scrape_all_rounds(args.start, args.end)
+            lotto_data = scraper.scrape_all_rounds(
+                args.start,
+                args.end,
+                skip_rounds=done_rounds,
+                checkpoint=processor.append_checkpoint
+            )
             
-            if not lotto_data:
+            if not lotto_data and existing_df.empty:
                 logger.error("스크래핑된 데이터가 없습니다.")
                 sys.exit(1)
             
-            # 데이터 처리
+            # 데이터 처리 (새 데이터는 process_data, 기존 데이터는 load_existing_data에서 검증됨)
             logger.info("데이터 처리 중...")
-            df = processor.process_data(lotto_data)
-            
-            # 데이터 검증
-            if not processor.validate_data(df):
-                logger.error("데이터 검증 실패")
-                sys.exit(1)
+            new_df = processor.process_data(lotto_data)
+            df = processor.merge_data(existing_df, new_df)
             
             # CSV 저장
             logger.info("CSV 파일 저장 중...")
             output_path = processor.save_to_csv(df)
+            processor.clear_checkpoint()
             
             # 통계 출력
             processor.print_statistics(df)
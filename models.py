@@ -2,29 +2,69 @@
 로또 데이터 모델
 """
 
+import numpy as np
 from dataclasses import dataclass
-from typing import List, Optional
-from datetime import datetime
+from typing import Tuple, Optional, Sequence, Dict
+from utils import winning_numbers_mask, validate_bonus_number_mask, validate_draw_date
 
+# to_dict 키 (필드 순서와 동일, 호출마다 리터럴을 다시 만들지 않도록 한 번만 생성)
+_KEYS = (
+    '회차', '추첨일', '당첨번호1', '당첨번호2', '당첨번호3',
+    '당첨번호4', '당첨번호5', '당첨번호6', '보너스번호',
+    '1등당첨자수', '1등당첨금액'
+)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class LottoData:
-    """로또 당첨 데이터 모델"""
+    """로또 당첨 데이터 모델 (불변 객체)"""
     round_num: int
     draw_date: str
-    winning_numbers: List[int]
+    winning_numbers: Tuple[int, ...]
     bonus_number: int
     first_prize_winners: int
     first_prize_amount: int
     
     def __post_init__(self):
         """데이터 검증"""
+        # 리스트로 전달되어도 불변/해시 가능하도록 튜플로 고정
+        object.__setattr__(self, 'winning_numbers', tuple(self.winning_numbers))
+        
         self._validate_numbers()
         self._validate_date()
         self._validate_amounts()
     
+    @classmethod
+    def construct_unchecked(
+        cls,
+        round_num: int,
+        draw_date: str,
+        winning_numbers: Tuple[int, ...],
+        bonus_number: int,
+        first_prize_winners: int,
+        first_prize_amount: int
+    ) -> 'LottoData':
+        """
+        검증 없이 객체 생성
+        
+        호출 측에서 행 전체(번호, 추첨일, 당첨자수/금액)를 이미 검증한 데이터에만 사용한다.
+        """
+        obj = object.__new__(cls)
+        object.__setattr__(obj, 'round_num', round_num)
+        object.__setattr__(obj, 'draw_date', draw_date)
+        object.__setattr__(obj, 'winning_numbers', tuple(winning_numbers))
+        object.__setattr__(obj, 'bonus_number', bonus_number)
+        object.__setattr__(obj, 'first_prize_winners', first_prize_winners)
+        object.__setattr__(obj, 'first_prize_amount', first_prize_amount)
+        return obj
+    
     def _validate_numbers(self):
         """당첨번호 및 보너스번호 검증"""
+        # 유효한 경우는 utils의 비트마스크 검사 한 번으로 끝낸다
+        mask = winning_numbers_mask(self.winning_numbers)
+        if mask is not None and validate_bonus_number_mask(self.bonus_number, mask):
+            return
+        
         # 당첨번호 검증
         if len(self.winning_numbers) != 6:
             raise ValueError(f"당첨번호는 6개여야 합니다. 현재: {len(self.winning_numbers)}개")
@@ -41,15 +81,12 @@ class LottoData:
         if self.bonus_number in self.winning_numbers:
             raise ValueError(f"보너스번호는 당첨번호와 중복될 수 없습니다. 보너스번호: {self.bonus_number}")
         
-        # 당첨번호 중복 검사
-        if len(set(self.winning_numbers)) != len(self.winning_numbers):
-            raise ValueError("당첨번호에 중복이 있습니다.")
+        # 남은 실패 원인은 당첨번호 중복
+        raise ValueError("당첨번호에 중복이 있습니다.")
     
     def _validate_date(self):
         """날짜 형식 검증"""
-        try:
-            datetime.strptime(self.draw_date, '%Y-%m-%d')
-        except ValueError:
+        if not validate_draw_date(self.draw_date):
             raise ValueError(f"날짜 형식이 올바르지 않습니다. 예상: YYYY-MM-DD, 현재: {self.draw_date}")
     
     def _validate_amounts(self):
@@ -62,16 +99,53 @@ class LottoData:
     
     def to_dict(self) -> dict:
         """딕셔너리로 변환"""
-        return {
-            '회차': self.round_num,
-            '추첨일': self.draw_date,
-            '당첨번호1': self.winning_numbers[0],
-            '당첨번호2': self.winning_numbers[1],
-            '당첨번호3': self.winning_numbers[2],
-            '당첨번호4': self.winning_numbers[3],
-            '당첨번호5': self.winning_numbers[4],
-            '당첨번호6': self.winning_numbers[5],
-            '보너스번호': self.bonus_number,
-            '1등당첨자수': self.first_prize_winners,
-            '1등당첨금액': self.first_prize_amount
-        }
+        return dict(zip(_KEYS, (
+            self.round_num,
+            self.draw_date,
+            *self.winning_numbers,
+            self.bonus_number,
+            self.first_prize_winners,
+            self.first_prize_amount
+        )))
+
+
+@dataclass(slots=True, frozen=True)
+class LottoBatch:
+    """로또 당첨 데이터 묶음 (회차별 객체 대신 컬럼별 NumPy 배열로 보관)"""
+    round_nums: np.ndarray           # int32 (N,)
+    draw_dates: np.ndarray           # str (N,)
+    winning_numbers: np.ndarray      # int8 (N, 6)
+    bonus_numbers: np.ndarray        # int8 (N,)
+    first_prize_winners: np.ndarray  # int32 (N,)
+    first_prize_amounts: np.ndarray  # int64 (N,)
+    
+    @classmethod
+    def from_records(cls, records: Sequence[LottoData]) -> 'LottoBatch':
+        """LottoData 목록을 컬럼별 배열로 변환"""
+        n = len(records)
+        return cls(
+            round_nums=np.fromiter((r.round_num for r in records), dtype=np.int32, count=n),
+            # 고정 길이(U10)로 자르지 않도록 최대 길이에 맞춘 문자열 배열 사용
+            draw_dates=np.array([r.draw_date for r in records], dtype=str),
+            # 행 단위로 변환해 번호 개수가 다른 행이 있으면 다른 행과 섞이지 않고 실패
+            winning_numbers=np.array(
+                [r.winning_numbers for r in records], dtype=np.int8
+            ).reshape(n, 6),
+            bonus_numbers=np.fromiter((r.bonus_number for r in records), dtype=np.int8, count=n),
+            first_prize_winners=np.fromiter((r.first_prize_winners for r in records), dtype=np.int32, count=n),
+            first_prize_amounts=np.fromiter((r.first_prize_amount for r in records), dtype=np.int64, count=n),
+        )
+    
+    def __len__(self) -> int:
+        return len(self.round_nums)
+    
+    def to_columns(self) -> Dict[str, np.ndarray]:
+        """컬럼명(to_dict 키)별 배열 딕셔너리로 변환"""
+        return dict(zip(_KEYS, (
+            self.round_nums,
+            self.draw_dates,
+            *self.winning_numbers.T,
+            self.bonus_numbers,
+            self.first_prize_winners,
+            self.first_prize_amounts
+        )))
@@ -0,0 +1,146 @@
+"""
+DataProcessor 테스트
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from models import LottoData
+from data_processor import DataProcessor
+from exceptions import DataValidationError
+
+
+def make_lotto_data(round_num: int) -> LottoData:
+    """테스트용 LottoData 생성"""
+    return LottoData(
+        round_num=round_num,
+        draw_date='2002-12-07',
+        winning_numbers=[10, 23, 29, 33, 37, 40],
+        bonus_number=16,
+        first_prize_winners=4,
+        first_prize_amount=2067000000
+    )
+
+
+class TestDataProcessor:
+    """DataProcessor 테스트 클래스"""
+    
+    @pytest.fixture
+    def processor(self, tmp_path):
+        return DataProcessor(str(tmp_path / 'lotto_numbers.csv'))
+    
+    def test_write_csv_matches_pandas(self, processor, tmp_path):
+        """CSV 쓰기 결과가 pandas to_csv 출력과 같은지 테스트"""
+        df = processor.process_data([make_lotto_data(1), make_lotto_data(2)])
+        float_df = df.astype({'1등당첨금액': float})
+        
+        int_label_df = pd.DataFrame({1: [1, 2], 2: [3, 4]})
+        
+        for frame in (df, float_df, int_label_df):
+            path = tmp_path / 'written.csv'
+            processor._write_csv(frame, path)
+            assert path.read_text(encoding='utf-8') == frame.to_csv(index=False)
+    
+    def test_merge_data(self, processor):
+        """기존 데이터와 새 데이터 병합 테스트"""
+        existing = processor.process_data([make_lotto_data(1), make_lotto_data(3)])
+        new = processor.process_data([make_lotto_data(2), make_lotto_data(3)])
+        
+        merged = processor.merge_data(existing, new)
+        
+        assert merged['회차'].tolist() == [1, 2, 3]
+        assert merged.index.tolist() == [0, 1, 2]
+    
+    def test_merge_data_with_empty(self, processor):
+        """빈 DataFrame 병합 테스트"""
+        df = processor.process_data([make_lotto_data(1)])
+        
+        assert processor.merge_data(pd.DataFrame(), df) is df
+        assert processor.merge_data(df, pd.DataFrame()) is df
+    
+    def test_checkpoint_resume(self, processor):
+        """중간 저장 후 이어받기 테스트"""
+        processor.save_to_csv(processor.process_data([make_lotto_data(1)]))
+        processor.append_checkpoint([make_lotto_data(2)])
+        processor.append_checkpoint([make_lotto_data(3)])
+        
+        existing = processor.load_existing_data()
+        assert existing['회차'].tolist() == [1, 2, 3]
+        
+        processor.clear_checkpoint()
+        assert not processor.checkpoint_path.exists()
+        assert processor.load_existing_data()['회차'].tolist() == [1]
+    
+    def test_checkpoint_skips_invalid_rows(self, processor):
+        """유효하지 않은 회차는 이어받기에서 제외되는지 테스트"""
+        invalid = LottoData.construct_unchecked(4, '', (1, 2, 3, 4, 5, 6), 7, 0, 0)
+        processor.append_checkpoint([make_lotto_data(3), invalid])
+        
+        assert processor.load_existing_data()['회차'].tolist() == [3]
+        
+        # 이전 실행에서 이미 잘못 저장된 회차는 다시 수집하도록 제외
+        with open(processor.checkpoint_path, 'a', encoding='utf-8') as f:
+            f.write('4,,1,2,3,4,5,6,7,0,0\n')
+        
+        existing = processor.load_existing_data()
+        assert existing['회차'].tolist() == [3]
+        
+        processor.save_to_csv(existing)
+        assert processor.load_from_csv()['회차'].tolist() == [3]
+    
+    def test_validate_data_number_range(self, processor):
+        """번호 범위 검사 테스트"""
+        df = processor.process_data([make_lotto_data(1), make_lotto_data(2)])
+        assert processor.validate_data(df) == True
+        
+        df.loc[1, '당첨번호3'] = 46
+        assert processor.validate_data(df) == False
+        
+        df.loc[1, '당첨번호3'] = 29
+        df.loc[0, '보너스번호'] = 0
+        assert processor.validate_data(df) == False
+        
+        # 빈 번호 칸(NaN)
+        df.loc[0, '보너스번호'] = 16
+        assert processor.validate_data(df) == True
+        df.loc[1, '당첨번호3'] = np.nan
+        assert processor.validate_data(df) == False
+        
+        # 범위 안이지만 당첨번호 중복 / 추첨일 누락
+        df.loc[1, '당첨번호3'] = 10
+        assert processor.validate_data(df) == False
+        df.loc[1, '당첨번호3'] = 29
+        df.loc[1, '추첨일'] = ''
+        assert processor.validate_data(df) == False
+    
+    def test_get_statistics(self, processor):
+        """통계 정보 생성 테스트"""
+        data = [make_lotto_data(1), make_lotto_data(2)]
+        df = processor.process_data(data)
+        df.loc[1, '1등당첨금액'] = 1000000000
+        
+        stats = processor.get_statistics(df)
+        
+        assert stats['총_회차수'] == 2
+        assert stats['시작_회차'] == 1
+        assert stats['종료_회차'] == 2
+        assert stats['평균_1등당첨자수'] == 4.0
+        assert stats['평균_1등당첨금액'] == 1533500000.0
+        assert stats['최대_1등당첨금액'] == 2067000000
+        assert stats['최소_1등당첨금액'] == 1000000000
+        assert processor.get_statistics(pd.DataFrame()) == {}
+    
+    def test_process_data_rejects_invalid_rows(self, processor):
+        """검증 없이 생성된 잘못된 데이터 일괄 검증 테스트"""
+        valid = make_lotto_data(1)
+        invalid_rows = [
+            LottoData.construct_unchecked(2, '2002-12-14', (1, 1, 2, 3, 4, 5), 6, 0, 0),  # 번호 중복
+            LottoData.construct_unchecked(3, '2002-12-21', (1, 2, 3, 4, 5, 6), 6, 0, 0),  # 보너스 중복
+            LottoData.construct_unchecked(4, '2002/12/28', (1, 2, 3, 4, 5, 6), 7, 0, 0),  # 날짜 형식
+            LottoData.construct_unchecked(5, '2003-01-04', (1, 2, 3, 4, 5, 46), 7, 0, 0),  # 범위 밖
+            LottoData.construct_unchecked(6, '2003-01-11', (1, 2, 3, 4, 5, 6), 7, -1, 0),  # 음수
+        ]
+        
+        for invalid in invalid_rows:
+            with pytest.raises(DataValidationError, match=rf"\[{invalid.round_num}\]"):
+                processor.process_data([valid, invalid])
@@ -0,0 +1,164 @@
+"""
+LottoScraper 파싱 테스트 (네트워크 요청 없음)
+"""
+
+import time
+import pytest
+import requests
+from lotto_scraper import LottoScraper, parse_lotto_row, _RESULT_SECTION_FILTER
+from exceptions import ParsingError, DataValidationError, RetryableNetworkError
+from config.settings import SCRAPING_CONFIG
+
+
+ROUND_JSON = {
+    'returnValue': 'success',
+    'drwNo': 1,
+    'drwNoDate': '2002-12-07',
+    'drwtNo1': 10,
+    'drwtNo2': 23,
+    'drwtNo3': 29,
+    'drwtNo4': 33,
+    'drwtNo5': 37,
+    'drwtNo6': 40,
+    'bnusNo': 16,
+    'firstPrzwnerCo': 0,
+    'firstWinamnt': 0,
+    'totSellamnt': 3681782000,
+}
+
+
+ROUND_HTML = """
+<html><head>
+<meta name="description" content="동행복권 1150회 당첨번호 8,9,18,35,39,45+25. 1등 총 11명, 1인당 당첨금액 2,380,255,864원. 추첨일 2024.12.14">
+</head><body>
+<div class="num win"><strong>당첨번호</strong><p>
+<span class="ball_645 lrg ball1">8</span><span class="ball_645 lrg ball1">9</span>
+<span class="ball_645 lrg ball2">18</span><span class="ball_645 lrg ball4">35</span>
+<span class="ball_645 lrg ball4">39</span><span class="ball_645 lrg ball5">45</span>
+</p></div>
+<div class="num bonus"><strong>보너스</strong><p><span class="ball_645 lrg ball3">25</span></p></div>
+<table class="tbl_data tbl_data_col"><tbody>
+<tr><td>1등</td><td>26,182,814,504원</td><td>11</td><td>2,380,255,864원</td><td>당첨번호 6개 숫자일치</td><td></td></tr>
+<tr><td>2등</td><td>4,363,802,448원</td><td>85</td><td>51,338,852원</td><td>당첨번호 5개 숫자일치 + 보너스</td><td></td></tr>
+</tbody></table>
+</body></html>
+"""
+
+
+class TestLottoScraper:
+    """LottoScraper 파싱 테스트 클래스"""
+    
+    @pytest.fixture
+    def scraper(self):
+        scraper = LottoScraper()
+        yield scraper
+        scraper.close()
+    
+    def test_parse_round_json(self, scraper):
+        """JSON API 응답 파싱 테스트"""
+        data = scraper._parse_round_json(ROUND_JSON, 1)
+        
+        assert data.round_num == 1
+        assert data.draw_date == '2002-12-07'
+        assert data.winning_numbers == (10, 23, 29, 33, 37, 40)
+        assert data.bonus_number == 16
+        assert data.first_prize_winners == 0
+        assert data.first_prize_amount == 0
+    
+    def test_parse_round_json_invalid(self, scraper):
+        """잘못된 JSON 응답 파싱 테스트"""
+        with pytest.raises(ParsingError):
+            scraper._parse_round_json(dict(ROUND_JSON, bnusNo=10), 1)  # 당첨번호와 중복
+        
+        with pytest.raises(ParsingError):
+            scraper._parse_round_json({'returnValue': 'success'}, 1)  # 필드 누락
+    
+    def test_parse_lotto_row(self):
+        """JSON 응답 한 건 변환 테스트"""
+        data = parse_lotto_row(dict(ROUND_JSON, drwNoDate='2002.12.07', firstWinamnt='2002006800'))
+        
+        assert data.draw_date == '2002-12-07'
+        assert data.winning_numbers == (10, 23, 29, 33, 37, 40)
+        assert data.first_prize_amount == 2002006800
+        
+        with pytest.raises(DataValidationError):
+            parse_lotto_row(dict(ROUND_JSON, drwtNo6=10))  # 당첨번호 중복
+        
+        with pytest.raises(DataValidationError):
+            parse_lotto_row(dict(ROUND_JSON, drwNoDate=''))  # 추첨일 누락
+        
+        with pytest.raises(DataValidationError):
+            parse_lotto_row(dict(ROUND_JSON, firstWinamnt=-1))  # 음수 금액
+        
+        with pytest.raises(KeyError):
+            parse_lotto_row({'returnValue': 'success'})
+    
+    def test_parse_round_html(self, scraper):
+        """HTML 결과 페이지 파싱 테스트"""
+        soup = scraper._make_soup(ROUND_HTML, parse_only=_RESULT_SECTION_FILTER)
+        data = scraper._parse_round_data(soup, 1150)
+        
+        assert data.draw_date == '2024-12-14'
+        assert data.winning_numbers == (8, 9, 18, 35, 39, 45)
+        assert data.bonus_number == 25
+        assert data.first_prize_winners == 11
+        assert data.first_prize_amount == 2380255864
+    
+    def test_scrape_all_rounds_interrupted(self):
+        """중단 시 대기 중인 회차 취소 및 미저장분 중간 저장 테스트"""
+        scraper = LottoScraper(dict(SCRAPING_CONFIG, CONCURRENCY=4, CHECKPOINT_INTERVAL=1000))
+        requested = []
+        saved = []
+        
+        def fake_scrape_round(round_num):
+            requested.append(round_num)
+            if round_num == 2:
+                time.sleep(0.05)
+                raise KeyboardInterrupt
+            if round_num > 2:
+                time.sleep(0.2)  # 중단 시점에 실행 중인 요청
+            return parse_lotto_row(dict(ROUND_JSON, drwNo=round_num))
+        
+        scraper.scrape_round = fake_scrape_round
+        try:
+            with pytest.raises(KeyboardInterrupt):
+                scraper.scrape_all_rounds(1, 100, checkpoint=saved.extend)
+        finally:
+            scraper.close()
+        
+        # 대기 중이던 회차는 요청하지 않고, 실행 중이던 요청 결과까지 모두 저장
+        assert max(requested) < 10
+        assert sorted(data.round_num for data in saved) == sorted(set(requested) - {2})
+        assert {1, 3, 4, 5} <= {data.round_num for data in saved}
+    
+    def test_make_request_uses_max_retries(self):
+        """MAX_RETRIES 설정만큼 요청을 재시도하는지 테스트"""
+        scraper = LottoScraper(dict(SCRAPING_CONFIG, MAX_RETRIES=2, RATE_LIMIT=1000.0))
+        calls = []
+        
+        def fail(*args, **kwargs):
+            calls.append(args)
+            raise requests.exceptions.ConnectionError("연결 실패")
+        
+        scraper.session.get = fail
+        try:
+            with pytest.raises(RetryableNetworkError):
+                scraper._make_request(SCRAPING_CONFIG['API_URL'])
+        finally:
+            scraper.close()
+        
+        assert len(calls) == 2
+    
+    def test_parse_round_html_date_in_body(self, scraper):
+        """메타 태그 없이 본문에만 추첨일이 있는 HTML 파싱 테스트"""
+        html = ROUND_HTML.replace('추첨일 2024.12.14', '').replace(
+            '<div class="num win">', '<p class="desc">2024.12.14 추첨</p><div class="num win">'
+        )
+        
+        full = scraper._parse_round_data(scraper._make_soup(html), 1150)
+        filtered = scraper._parse_round_data(
+            scraper._make_soup(html, parse_only=_RESULT_SECTION_FILTER), 1150
+        )
+        
+        assert full.draw_date == '2024-12-14'
+        assert filtered == full
@@ -3,7 +3,10 @@ LottoData 모델 테스트
 """
 
 import pytest
-from models import LottoData
+from dataclasses import FrozenInstanceError
+import numpy as np
+from models import LottoData, LottoBatch
+from config.settings import CSV_CONFIG
 
 
 class TestLottoData:
@@ -22,11 +25,43 @@ class TestLottoData:
         
         assert data.round_num == 1
         assert data.draw_date == '2002-12-07'
-        assert data.winning_numbers == [10, 23, 29, 33, 37, 40]
+        assert data.winning_numbers == (10, 23, 29, 33, 37, 40)
         assert data.bonus_number == 16
         assert data.first_prize_winners == 4
         assert data.first_prize_amount == 2067000000
     
+    def test_immutable_and_hashable(self):
+        """불변 객체 및 해시 가능 여부 테스트"""
+        data = LottoData(
+            round_num=1,
+            draw_date='2002-12-07',
+            winning_numbers=[10, 23, 29, 33, 37, 40],
+            bonus_number=16,
+            first_prize_winners=4,
+            first_prize_amount=2067000000
+        )
+        
+        with pytest.raises(FrozenInstanceError):
+            data.round_num = 2
+        
+        assert not hasattr(data, '__dict__')
+        assert len({data, data}) == 1
+    
+    def test_construct_unchecked(self):
+        """검증 없는 생성 테스트"""
+        data = LottoData.construct_unchecked(
+            round_num=1,
+            draw_date='2002/12/07',  # 검증하지 않으므로 그대로 저장
+            winning_numbers=[10, 23, 29, 33, 37, 40],
+            bonus_number=16,
+            first_prize_winners=4,
+            first_prize_amount=2067000000
+        )
+        
+        assert data.draw_date == '2002/12/07'
+        assert data.winning_numbers == (10, 23, 29, 33, 37, 40)
+        assert data == LottoData.construct_unchecked(1, '2002/12/07', (10, 23, 29, 33, 37, 40), 16, 4, 2067000000)
+    
     def test_invalid_winning_numbers_count(self):
         """잘못된 당첨번호 개수 테스트"""
         with pytest.raises(ValueError, match="당첨번호는 6개여야 합니다"):
@@ -51,6 +86,18 @@ class TestLottoData:
                 first_prize_amount=2067000000
             )
     
+    def test_numeric_number_types(self):
+        """NumPy 정수/실수 번호로 생성 테스트"""
+        for numbers, bonus in [
+            (list(np.array([10, 23, 29, 33, 37, 45], dtype=np.int8)), np.int8(16)),
+            ([10.0, 23.0, 29.0, 33.0, 37.0, 45.0], 16.0),
+        ]:
+            data = LottoData(1, '2002-12-07', numbers, bonus, 4, 2067000000)
+            assert data.winning_numbers == (10, 23, 29, 33, 37, 45)
+        
+        with pytest.raises(ValueError, match="당첨번호에 중복이 있습니다"):
+            LottoData(1, '2002-12-07', [10.0, 23.0, 29.0, 33.0, 37.0, 10.0], 16.0, 4, 0)
+    
     def test_duplicate_winning_numbers(self):
         """중복된 당첨번호 테스트"""
         with pytest.raises(ValueError, match="당첨번호에 중복이 있습니다"):
@@ -115,3 +162,57 @@ class TestLottoData:
         }
         
         assert result == expected
+    
+    def test_to_dict_keys_match_csv_columns(self):
+        """to_dict 키 순서가 CSV 컬럼 순서와 같은지 테스트"""
+        data = LottoData(
+            round_num=1,
+            draw_date='2002-12-07',
+            winning_numbers=[10, 23, 29, 33, 37, 40],
+            bonus_number=16,
+            first_prize_winners=4,
+            first_prize_amount=2067000000
+        )
+        
+        assert list(data.to_dict()) == CSV_CONFIG['COLUMNS']
+
+
+class TestLottoBatch:
+    """LottoBatch 테스트 클래스"""
+    
+    def test_from_records(self):
+        """컬럼별 배열 변환 테스트"""
+        records = [
+            LottoData(1, '2002-12-07', [10, 23, 29, 33, 37, 40], 16, 0, 0),
+            LottoData(2, '2002-12-14', [9, 13, 21, 25, 32, 42], 2, 2, 2002006800),
+        ]
+        
+        batch = LottoBatch.from_records(records)
+        
+        assert len(batch) == 2
+        assert batch.winning_numbers.shape == (2, 6)
+        assert batch.winning_numbers.dtype == np.int8
+        assert batch.first_prize_amounts.dtype == np.int64
+        
+        columns = batch.to_columns()
+        assert list(columns) == CSV_CONFIG['COLUMNS']
+        assert [
+            {key: value[i].item() for key, value in columns.items()} for i in range(len(batch))
+        ] == [record.to_dict() for record in records]
+    
+    def test_from_records_empty(self):
+        """빈 목록 변환 테스트"""
+        batch = LottoBatch.from_records([])
+        
+        assert len(batch) == 0
+        assert batch.winning_numbers.shape == (0, 6)
+    
+    def test_from_records_rejects_ragged_rows(self):
+        """당첨번호 개수가 다른 행이 섞이면 실패하는지 테스트"""
+        records = [
+            LottoData.construct_unchecked(1, '2002-12-07', (1, 2, 3, 4, 5), 7, 0, 0),
+            LottoData.construct_unchecked(2, '2002-12-14', (1, 2, 3, 4, 5, 6, 8), 7, 0, 0),
+        ]
+        
+        with pytest.raises(ValueError):
+            LottoBatch.from_records(records)
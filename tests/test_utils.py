@@ -2,10 +2,16 @@
 유틸리티 함수 테스트
 """
 
+import time
+import numpy as np
 import pytest
 from utils import (
     clean_number_string, parse_date_string, validate_winning_numbers,
-    validate_bonus_number, safe_int, safe_float
+    validate_bonus_number, safe_int, safe_float, RateLimiter,
+    winning_numbers_mask, validate_bonus_number_mask,
+    parse_retry_after, retry_on_exception,
+    validate_winning_numbers_batch, validate_bonus_number_batch,
+    format_amount, format_amount_batch
 )
 
 
@@ -63,6 +69,62 @@ class TestUtils:
         assert validate_bonus_number(1, winning_numbers) == False
         assert validate_bonus_number(6, winning_numbers) == False
     
+    def test_validate_numbers_numeric_types(self):
+        """NumPy 정수/실수 번호 유효성 검사 테스트"""
+        int8_numbers = list(np.array([10, 23, 29, 33, 37, 45], dtype=np.int8))
+        float_numbers = [10.0, 23.0, 29.0, 33.0, 37.0, 45.0]
+        
+        assert validate_winning_numbers(int8_numbers) == True
+        assert validate_winning_numbers(float_numbers) == True
+        assert validate_winning_numbers([10.0, 10.0, 29.0, 33.0, 37.0, 45.0]) == False
+        assert validate_winning_numbers([10.0, float('nan'), 29.0, 33.0, 37.0, 45.0]) == False
+        
+        mask = winning_numbers_mask(int8_numbers)
+        assert validate_bonus_number_mask(np.int8(44), mask) == True
+        assert validate_bonus_number_mask(np.int8(45), mask) == False
+    
+    def test_validate_bonus_number_mask(self):
+        """비트마스크 기반 보너스번호 유효성 검사 테스트"""
+        winning_numbers = [1, 2, 3, 4, 5, 45]
+        mask = winning_numbers_mask(winning_numbers)
+        
+        assert mask == 0b11111 | (1 << 44)
+        assert winning_numbers_mask([1, 1, 2, 3, 4, 5]) is None
+        assert winning_numbers_mask([0, 1, 2, 3, 4, 5]) is None
+        
+        for bonus in range(0, 47):
+            assert validate_bonus_number_mask(bonus, mask) == validate_bonus_number(bonus, winning_numbers)
+    
+    def test_validate_numbers_batch(self):
+        """당첨번호/보너스번호 일괄 유효성 검사 테스트"""
+        numbers = np.array([
+            [1, 2, 3, 4, 5, 6],
+            [45, 44, 43, 42, 41, 40],
+            [0, 1, 2, 3, 4, 5],    # 0 포함
+            [1, 2, 3, 4, 5, 46],   # 46 포함
+            [1, 1, 2, 3, 4, 5],    # 1 중복
+        ], dtype=np.int8)
+        bonus = np.array([7, 40, 7, 7, 7], dtype=np.int8)  # 두 번째 행은 당첨번호와 중복
+        
+        assert validate_winning_numbers_batch(numbers).tolist() == [True, True, False, False, False]
+        assert validate_bonus_number_batch(bonus, numbers).tolist() == [True, False, True, True, True]
+        
+        # 단일 행 검사와 결과가 같아야 한다
+        assert validate_winning_numbers_batch(numbers).tolist() == [
+            validate_winning_numbers(row.tolist()) for row in numbers
+        ]
+        
+        # 잘못된 형태
+        assert validate_winning_numbers_batch(np.array([[1, 2, 3, 4, 5]])).tolist() == [False]
+    
+    def test_format_amount_batch(self):
+        """금액 일괄 포맷 테스트"""
+        amounts = np.array([0, 1000, 2067000000], dtype=np.int64)
+        
+        assert format_amount_batch(amounts).tolist() == ["0", "1,000", "2,067,000,000"]
+        assert format_amount_batch(amounts).tolist() == [format_amount(int(x)) for x in amounts]
+        assert format_amount_batch([]).tolist() == []
+    
     def test_safe_int(self):
         """안전한 정수 변환 테스트"""
         assert safe_int("123") == 123
@@ -72,6 +134,8 @@ class TestUtils:
         assert safe_int("abc") == 0
         assert safe_int("123", default=999) == 123
         assert safe_int("", default=999) == 999
+        assert safe_int(45) == 45
+        assert safe_int(0, default=999) == 0
     
     def test_safe_float(self):
         """안전한 실수 변환 테스트"""
@@ -82,3 +146,54 @@ class TestUtils:
         assert safe_float("abc") == 0.0
         assert safe_float("123.45", default=999.0) == 123.45
         assert safe_float("", default=999.0) == 999.0
+        assert safe_float(1.5) == 1.5
+        assert safe_float(3) == 3.0 and isinstance(safe_float(3), float)
+        assert safe_float(0, default=999.0) == 0.0
+    
+    def test_rate_limiter(self):
+        """요청 속도 제한 테스트"""
+        limiter = RateLimiter(rate=50.0)
+        
+        started = time.monotonic()
+        for _ in range(6):
+            limiter.acquire()
+        elapsed = time.monotonic() - started
+        
+        # 첫 요청은 즉시, 이후 5개는 1/50초 간격
+        assert elapsed >= 5 / 50.0 * 0.9
+    
+    def test_parse_retry_after(self):
+        """Retry-After 헤더 파싱 테스트"""
+        assert parse_retry_after("3") == 3.0
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0  # 지난 시각
+        assert parse_retry_after("") is None
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("invalid") is None
+    
+    def test_retry_on_exception(self):
+        """지정한 예외만 재시도하는지 테스트"""
+        calls = []
+        
+        @retry_on_exception(max_retries=3, delay=0, exceptions=(ConnectionError,))
+        def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise ConnectionError("일시적 오류")
+            return "ok"
+        
+        assert flaky() == "ok"
+        assert len(calls) == 3
+        
+        @retry_on_exception(max_retries=3, delay=0, exceptions=(ConnectionError,))
+        def broken():
+            calls.append(1)
+            raise ValueError("재시도 대상 아님")
+        
+        calls.clear()
+        with pytest.raises(ValueError):
+            broken()
+        assert len(calls) == 1
+        
+        # 원래 함수 정보 유지
+        assert flaky.__name__ == 'flaky'
+        assert flaky.__wrapped__ is not None
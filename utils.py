@@ -4,53 +4,120 @@
 
 import re
 import time
+import random
 import logging
-from typing import List, Optional
+import atexit
+import threading
+import numpy as np
+from queue import Queue
+from logging.handlers import QueueHandler, QueueListener
+from functools import wraps
+from typing import List, Optional, Tuple, Type, Dict, Set
 from pathlib import Path
+from datetime import date
+from email.utils import parsedate_to_datetime
 from config.settings import PATHS, LOGGING_CONFIG
 
+# 로깅 포매터와 레벨 이름 → 레벨 값 캐시 (setup_logging 호출마다 재생성하지 않음)
+_FORMATTER = logging.Formatter(LOGGING_CONFIG['FORMAT'])
+_LEVEL_CACHE: Dict[str, int] = {}
+
+# 로그 기록은 큐에 넣고 실제 콘솔/파일 출력은 백그라운드 리스너 스레드가 담당
+_LOG_QUEUE: Queue = Queue(-1)
+_LISTENER: Optional[QueueListener] = None
+
+# 이번 실행에서 이미 생성(확인)한 디렉토리
+_CREATED_DIRS: Set[Path] = set()
+
+# 날짜 구분자(. - /)는 역참조로 앞뒤가 같은 경우만 허용
+_DATE_RE = re.compile(r'(\d{4})([./-])(\d{1,2})\2(\d{1,2})')
+
+# 숫자가 아닌 문자
+_NON_DIGIT = re.compile(r'\D')
+
+# 정규화된 추첨일(YYYY-MM-DD) 형식
+_ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+
+def _ensure_dir(path: Path) -> Path:
+    """디렉토리 생성 (이미 생성한 경로는 mkdir 시스템 콜 생략)"""
+    if path not in _CREATED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _CREATED_DIRS.add(path)
+    return path
+
 
 def setup_logging(log_level: str = 'INFO') -> logging.Logger:
     """로깅 설정"""
-    # 로그 디렉토리 생성
-    PATHS['LOGS_DIR'].mkdir(exist_ok=True)
+    level = _LEVEL_CACHE.get(log_level)
+    if level is None:
+        level = _LEVEL_CACHE[log_level] = getattr(logging, log_level.upper())
     
     # 로거 설정
     logger = logging.getLogger('lotto_scraper')
-    logger.setLevel(getattr(logging, log_level.upper()))
     
-    # 핸들러가 이미 있으면 제거
-    if logger.handlers:
-        logger.handlers.clear()
+    # 같은 레벨로 이미 설정되어 있으면 핸들러를 다시 만들지 않음
+    if logger.handlers and logger.level == level:
+        return logger
+    
+    # 로그 디렉토리 생성
+    _ensure_dir(PATHS['LOGS_DIR'])
+    
+    logger.setLevel(level)
+    
+    # 기존 리스너와 핸들러 정리
+    _stop_listener()
+    logger.handlers.clear()
     
     # 콘솔 핸들러
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(getattr(logging, log_level.upper()))
+    console_handler.setLevel(level)
     
     # 파일 핸들러
     log_file = PATHS['LOGS_DIR'] / 'lotto_scraper.log'
     file_handler = logging.FileHandler(log_file, encoding='utf-8')
     file_handler.setLevel(logging.DEBUG)
     
-    # 포매터
-    formatter = logging.Formatter(LOGGING_CONFIG['FORMAT'])
-    console_handler.setFormatter(formatter)
-    file_handler.setFormatter(formatter)
+    # 포매터 (모듈 전역 객체 재사용)
+    console_handler.setFormatter(_FORMATTER)
+    file_handler.setFormatter(_FORMATTER)
     
-    # 핸들러 추가
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    # 스크래핑 스레드는 큐에 넣기만 하고, 디스크/콘솔 쓰기는 리스너 스레드에서 수행
+    global _LISTENER
+    _LISTENER = QueueListener(_LOG_QUEUE, console_handler, file_handler, respect_handler_level=True)
+    _LISTENER.start()
+    logger.addHandler(QueueHandler(_LOG_QUEUE))
     
     return logger
 
 
+def _stop_listener() -> None:
+    """로그 리스너 종료 (큐에 남은 기록을 모두 출력한 뒤 핸들러 닫기)"""
+    global _LISTENER
+    if _LISTENER is None:
+        return
+    
+    _LISTENER.stop()
+    for handler in _LISTENER.handlers:
+        handler.close()
+    _LISTENER = None
+
+
+atexit.register(_stop_listener)
+
+
 def clean_number_string(text: str) -> int:
     """숫자 문자열을 정수로 변환 (콤마 제거)"""
     if not text:
         return 0
     
+    # 흔한 입력("1,234,567", "28")은 정규식 없이 바로 변환
+    cleaned = text.replace(',', '')
+    if cleaned.isascii() and cleaned.isdigit():
+        return int(cleaned)
+    
     # 숫자가 아닌 문자 제거
-    cleaned = re.sub(r'[^\d]', '', text)
+    cleaned = _NON_DIGIT.sub('', text)
     return int(cleaned) if cleaned else 0
 
 
@@ -59,39 +126,60 @@ def parse_date_string(date_str: str) -> str:
     if not date_str:
         return ""
     
-    # 다양한 날짜 형식 처리
-    date_patterns = [
-        r'(\d{4})\.(\d{1,2})\.(\d{1,2})',  # 2024.12.19
-        r'(\d{4})-(\d{1,2})-(\d{1,2})',   # 2024-12-19
-        r'(\d{4})/(\d{1,2})/(\d{1,2})',   # 2024/12/19
-    ]
+    # 이미 YYYY-MM-DD 형식이면 정규식 없이 그대로 반환
+    if (len(date_str) == 10 and date_str[4] == '-' == date_str[7] and date_str.isascii()
+            and date_str[:4].isdigit() and date_str[5:7].isdigit() and date_str[8:].isdigit()):
+        return date_str
     
-    for pattern in date_patterns:
-        match = re.search(pattern, date_str)
-        if match:
-            year, month, day = match.groups()
-            return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
+    # 2024.12.19 / 2024-12-19 / 2024/12/19 형식을 한 번의 탐색으로 처리
+    match = _DATE_RE.search(date_str)
+    if match:
+        year, _, month, day = match.groups()
+        return f"{year}-{int(month):02d}-{int(day):02d}"
     
     return date_str
 
 
-def validate_winning_numbers(numbers: List[int]) -> bool:
-    """당첨번호 유효성 검사"""
-    if len(numbers) != 6:
+def validate_draw_date(date_str: str) -> bool:
+    """추첨일(YYYY-MM-DD) 유효성 검사"""
+    # 정규식으로 형식을 먼저 거르고, 실제 날짜 여부만 fromisoformat으로 확인
+    if not isinstance(date_str, str) or not _ISO_DATE_RE.fullmatch(date_str):
         return False
     
-    # 범위 검사
-    for num in numbers:
-        if not (1 <= num <= 45):
-            return False
-    
-    # 중복 검사
-    if len(set(numbers)) != len(numbers):
+    try:
+        date.fromisoformat(date_str)
+    except ValueError:
         return False
     
     return True
 
 
+def winning_numbers_mask(numbers: List[int]) -> Optional[int]:
+    """
+    당첨번호를 비트마스크(번호 n → n-1번째 비트)로 변환
+    
+    Returns:
+        유효한 당첨번호면 비트마스크, 아니면 None
+    """
+    if len(numbers) != 6:
+        return None
+    
+    # 범위 검사와 함께 번호별 비트를 모아 한 번의 순회로 중복까지 판별
+    # (NumPy 정수·실수도 그대로 받을 수 있도록 범위 확인 후 int로 바꿔 시프트)
+    mask = 0
+    for num in numbers:
+        if not (1 <= num <= 45):
+            return None
+        mask |= 1 << (int(num) - 1)
+    
+    return mask if mask.bit_count() == 6 else None
+
+
+def validate_winning_numbers(numbers: List[int]) -> bool:
+    """당첨번호 유효성 검사"""
+    return winning_numbers_mask(numbers) is not None
+
+
 def validate_bonus_number(bonus: int, winning_numbers: List[int]) -> bool:
     """보너스번호 유효성 검사"""
     # 범위 검사
@@ -105,11 +193,51 @@ def validate_bonus_number(bonus: int, winning_numbers: List[int]) -> bool:
     return True
 
 
+def validate_bonus_number_mask(bonus: int, winning_mask: int) -> bool:
+    """보너스번호 유효성 검사 (winning_numbers_mask로 구한 비트마스크 사용)"""
+    return 1 <= bonus <= 45 and not (winning_mask & (1 << (int(bonus) - 1)))
+
+
+def validate_winning_numbers_batch(numbers: np.ndarray) -> np.ndarray:
+    """
+    당첨번호 일괄 유효성 검사
+    
+    Args:
+        numbers: (N, 6) 정수 배열
+        
+    Returns:
+        행별 검사 결과 (N,) bool 배열
+    """
+    numbers = np.asarray(numbers)
+    if numbers.ndim != 2 or numbers.shape[1] != 6:
+        return np.zeros(len(numbers), dtype=bool)
+    
+    in_range = ((numbers >= 1) & (numbers <= 45)).all(axis=1)
+    # 행별로 정렬한 뒤 이웃한 값이 같으면 중복
+    unique = (np.diff(np.sort(numbers, axis=1), axis=1) != 0).all(axis=1)
+    return in_range & unique
+
+
+def validate_bonus_number_batch(bonus: np.ndarray, winning_numbers: np.ndarray) -> np.ndarray:
+    """
+    보너스번호 일괄 유효성 검사
+    
+    Args:
+        bonus: (N,) 정수 배열
+        winning_numbers: (N, 6) 정수 배열
+        
+    Returns:
+        행별 검사 결과 (N,) bool 배열
+    """
+    bonus = np.asarray(bonus)
+    in_range = (bonus >= 1) & (bonus <= 45)
+    not_duplicated = ~(np.asarray(winning_numbers) == bonus[:, None]).any(axis=1)
+    return in_range & not_duplicated
+
+
 def create_output_directory() -> Path:
     """출력 디렉토리 생성"""
-    output_dir = PATHS['DATA_DIR']
-    output_dir.mkdir(exist_ok=True)
-    return output_dir
+    return _ensure_dir(PATHS['DATA_DIR'])
 
 
 def format_amount(amount: int) -> str:
@@ -117,44 +245,133 @@ def format_amount(amount: int) -> str:
     return f"{amount:,}"
 
 
+def format_amount_batch(amounts) -> np.ndarray:
+    """금액 배열을 천단위 콤마 형식 문자열 배열로 일괄 변환"""
+    # tolist()로 한 번에 파이썬 정수로 바꾼 뒤 포맷 (원소별 NumPy 스칼라 변환 생략)
+    values = np.asarray(amounts, dtype=np.int64).tolist()
+    return np.array([f"{value:,}" for value in values], dtype=object)
+
+
 def safe_int(value: str, default: int = 0) -> int:
     """안전한 정수 변환"""
+    # 이미 정수면 변환 생략 (bool은 제외)
+    if type(value) is int:
+        return value
+    
+    if not value:
+        return default
+    
     try:
-        if not value:
-            return default
-        # 소수점이 있는 경우 정수 부분만 추출
-        if '.' in str(value):
-            return int(float(value))
         return int(value)
     except (ValueError, TypeError):
+        pass
+    
+    # 소수점이 있는 경우 정수 부분만 추출
+    try:
+        return int(float(value))
+    except (ValueError, TypeError, OverflowError):
         return default
 
 
 def safe_float(value: str, default: float = 0.0) -> float:
     """안전한 실수 변환"""
+    # 이미 숫자면 문자열 변환 경로 생략 (bool은 제외)
+    if type(value) is float:
+        return value
+    if type(value) is int:
+        return float(value)
+    
     try:
         return float(value) if value else default
     except (ValueError, TypeError):
         return default
 
 
-def retry_on_exception(max_retries: int = 3, delay: float = 1.0):
-    """예외 발생 시 재시도 데코레이터"""
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더 값(초 또는 HTTP 날짜)을 대기 시간(초)으로 변환"""
+    if not value:
+        return None
+    
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def retry_on_exception(
+    max_retries: int = 3,
+    delay: float = 1.0,
+    max_delay: float = 10.0,
+    exceptions: Tuple[Type[BaseException], ...] = (Exception,)
+):
+    """
+    예외 발생 시 재시도 데코레이터
+    
+    지수 백오프에 full jitter를 적용해 동시 요청들의 재시도 시점을 분산한다.
+    예외에 retry_after 속성이 있으면 그 값을 우선 사용한다.
+    
+    Args:
+        max_retries: 최대 시도 횟수
+        delay: 백오프 기본 간격 (초)
+        max_delay: 최대 대기 시간 (초)
+        exceptions: 재시도할 예외 타입 (그 외 예외는 즉시 전파)
+    """
+    attempts = max(1, max_retries)
+    # 시도별 백오프 상한은 데코레이터 적용 시 한 번만 계산
+    backoff_caps = [min(max_delay, delay * (1 << i)) for i in range(attempts - 1)]
+    
     def decorator(func):
+        @wraps(func)
         def wrapper(*args, **kwargs):
-            last_exception = None
-            
-            for attempt in range(max_retries):
+            for attempt in range(attempts):
                 try:
                     return func(*args, **kwargs)
-                except Exception as e:
-                    last_exception = e
-                    if attempt < max_retries - 1:
-                        time.sleep(delay * (2 ** attempt))  # 지수 백오프
-                        continue
+                except exceptions as e:
+                    if attempt == attempts - 1:
+                        raise
+                    
+                    retry_after = getattr(e, 'retry_after', None)
+                    if retry_after is not None:
+                        wait = min(retry_after, max_delay)
                     else:
-                        raise last_exception
-            
-            return None
+                        wait = random.uniform(0, backoff_caps[attempt])  # 지수 백오프 + jitter
+                    time.sleep(wait)
         return wrapper
     return decorator
+
+
+class RateLimiter:
+    """토큰 버킷 방식의 요청 속도 제한기 (여러 스레드가 하나의 예산을 공유)"""
+    
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        Args:
+            rate: 초당 허용 요청 수
+            capacity: 한 번에 몰아서 보낼 수 있는 최대 요청 수
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """토큰을 하나 얻을 때까지 대기"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                
+                wait = (1 - self._tokens) / self.rate
+            
+            time.sleep(wait)